@@ -25,11 +25,88 @@ class FileRef:
     raw_sha256: str
 
 
+_CHUNK_SIZE = 1024 * 1024
+
+# Below this size the thread hand-off costs more than it hides.
+_PIPELINE_THRESHOLD = 8 * _CHUNK_SIZE
+
+
 def sha256_file(path: Path) -> str:
+    # hashlib dispatches to OpenSSL's hardware-accelerated SHA-256 where
+    # the CPU supports it; large files additionally overlap reads with
+    # hashing via the pipelined path below.
+    try:
+        if path.stat().st_size >= _PIPELINE_THRESHOLD:
+            return _sha256_file_pipelined(path)
+    except OSError:
+        pass
+    with path.open("rb", buffering=0) as f:
+        # Python 3.11+: one C-level read/update loop, GIL released.
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        # 3.10 fallback: readinto a preallocated buffer; avoids a fresh
+        # bytes object per chunk.
+        h = hashlib.sha256()
+        buf = bytearray(_CHUNK_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+        return h.hexdigest()
+
+
+def _sha256_file_pipelined(path: Path) -> str:
+    """Hash a large file with reads overlapped against SHA updates.
+
+    A reader thread fills a two-slot buffer ring while the main thread
+    hashes the previous slot; hashlib releases the GIL during update, so
+    read latency on cold pages is hidden behind the hash. The digest is
+    identical to the sequential path.
+    """
+
+    import threading
+
+    buffers = [bytearray(_CHUNK_SIZE), bytearray(_CHUNK_SIZE)]
+    counts = [0, 0]
+    filled = threading.Semaphore(0)
+    free = threading.Semaphore(2)
+    read_error: list[BaseException] = []
+
+    def _reader(f) -> None:
+        i = 0
+        while True:
+            free.acquire()
+            try:
+                n = f.readinto(buffers[i % 2])
+            except BaseException as e:  # propagate to the hashing thread
+                read_error.append(e)
+                counts[i % 2] = 0
+                filled.release()
+                return
+            counts[i % 2] = n
+            filled.release()
+            if not n:
+                return
+            i += 1
+
     h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+    with path.open("rb", buffering=0) as f:
+        t = threading.Thread(target=_reader, args=(f,), daemon=True)
+        t.start()
+        i = 0
+        while True:
+            filled.acquire()
+            n = counts[i % 2]
+            if not n:
+                break
+            h.update(memoryview(buffers[i % 2])[:n])
+            free.release()
+            i += 1
+        t.join()
+    if read_error:
+        raise read_error[0]
     return h.hexdigest()
 
 
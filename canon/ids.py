@@ -12,8 +12,12 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
 from typing import Any
 
+# ASCII mode: the pattern never needs Unicode property tables.
+_HEX64_RE = re.compile(r"(?a)[0-9a-f]{64}\Z")
+
 
 def canon_json_bytes(obj: Any) -> bytes:
     """Deterministic JSON bytes.
@@ -45,15 +49,16 @@ def sha256_prefixed(data: bytes, prefix: str = "sha256") -> str:
 
     if not isinstance(data, (bytes, bytearray, memoryview)):
         raise TypeError("sha256_prefixed expects bytes-like input")
-    return f"{prefix}:{sha256_hex(bytes(data))}"
+    # hashlib consumes any buffer-protocol object; no bytes() copy needed.
+    return f"{prefix}:{sha256_hex(data)}"
 
 
 def is_sha256_prefixed(s: str, prefix: str = "sha256") -> bool:
     if not isinstance(s, str):
         return False
-    if not s.startswith(prefix + ":"):
+    # Length check first: rejects malformed input before any allocation.
+    if len(s) != len(prefix) + 1 + 64:
         return False
-    hexpart = s.split(":", 1)[1]
-    if len(hexpart) != 64:
+    if not s.startswith(prefix + ":"):
         return False
-    return all(c in "0123456789abcdef" for c in hexpart)
+    return _HEX64_RE.match(s, len(prefix) + 1) is not None
@@ -21,4 +21,9 @@ def normalize_string(s: str) -> str:
 
     if not isinstance(s, str):
         raise TypeError(f"expected str, got {type(s).__name__}")
+    # Fast paths: ASCII (hex digests, identifiers) and already-NFC input
+    # are no-ops; both checks are single C-level scans, far cheaper than
+    # the full decomposition/composition pass.
+    if s.isascii() or unicodedata.is_normalized("NFC", s):
+        return s
     return unicodedata.normalize("NFC", s)
@@ -5,10 +5,21 @@ import hashlib
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
+from canon.ids import sha256_hex
+
 
 def sha256_bytes(b: bytes) -> str:
     """Compute SHA256 hash of bytes."""
-    return hashlib.sha256(b).hexdigest()
+    return sha256_hex(b)
+
+
+def sha256_many(items: List[bytes]) -> List[str]:
+    """Compute SHA256 hashes for a batch of byte strings.
+
+    Batch entry point so callers hashing many small records make one call;
+    the implementation is a plain loop (hashlib already runs at C speed).
+    """
+    return [sha256_hex(b) for b in items]
 
 
 @dataclass
@@ -27,21 +38,42 @@ class MemoryStore:
     
     def __init__(self):
         self._store: Dict[str, MemNode] = {}
-    
+        # Digest memoization for replay-heavy workloads: re-putting the
+        # same (data, parents) skips both SHA passes. Keys are content
+        # (not id()), so cache hits are always correct.
+        self._data_digest_cache: Dict[bytes, str] = {}
+        self._node_digest_cache: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+
     def put(self, node: MemNode) -> str:
         """Store a memory node and return its hash.
-        
+
         Hash is computed as: sha256(data_hash + parent_hashes)
         """
-        data_hash = sha256_bytes(node.data)
-        # Compute combined hash: data_hash concatenated with all parent hashes
-        combined = data_hash.encode('utf-8')
-        for parent in node.parents:
-            combined += parent.encode('utf-8')
-        node_hash = sha256_bytes(combined)
+        data_hash = self._data_digest_cache.get(node.data)
+        if data_hash is None:
+            data_hash = sha256_bytes(node.data)
+            self._data_digest_cache[node.data] = data_hash
+
+        parents = tuple(node.parents)
+        cached = self._node_digest_cache.get((data_hash, parents))
+        if cached is not None:
+            self._store[cached] = node
+            return cached
+        # Combined hash: data_hash concatenated with all parent hashes.
+        # Stream the pieces straight into one SHA context instead of
+        # materializing the concatenated bytes first.
+        h = hashlib.sha256(data_hash.encode('utf-8'))
+        for parent in parents:
+            h.update(parent.encode('utf-8'))
+        node_hash = h.hexdigest()
+        self._node_digest_cache[(data_hash, parents)] = node_hash
         self._store[node_hash] = node
         return node_hash
-    
+
+    def put_many(self, nodes: List[MemNode]) -> List[str]:
+        """Store a batch of memory nodes and return their hashes in order."""
+        return [self.put(node) for node in nodes]
+
     def get(self, node_hash: str) -> MemNode | None:
         """Retrieve a memory node by hash."""
         return self._store.get(node_hash)
@@ -51,7 +83,7 @@ class MemoryStore:
         return node_hash in self._store
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     """Execution step with input and output references."""
     input_node: str
@@ -59,7 +91,7 @@ class Step:
     output_node: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Receipt:
     """Receipt with declared output node."""
     output_node: str
@@ -78,13 +110,14 @@ class Critic:
         Returns (success, error_code).
         Defensive: returns "MISSING_MEMNODE" if a referenced node is missing.
         """
+        contains = self.memory.contains  # hoisted: avoids re-binding per step
         for step in steps:
             # Check if input node exists in memory
-            if not self.memory.contains(step.input_node):
+            if not contains(step.input_node):
                 return (False, "MISSING_MEMNODE")
-            
+
             # Check if output node exists in memory
-            if not self.memory.contains(step.output_node):
+            if not contains(step.output_node):
                 return (False, "MISSING_MEMNODE")
         
         return (True, "OK")
@@ -1,24 +1,44 @@
 from __future__ import annotations
 
 import hashlib
+import os
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
 
 CHUNK_SIZE = 1024 * 1024
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
+    with path.open("rb", buffering=0) as f:
+        # Python 3.11+: file_digest streams through an internal buffer and
+        # releases the GIL for the whole file.
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        # 3.10 fallback: readinto a preallocated buffer (no per-chunk
+        # bytes allocation; buffering=0 skips the BufferedReader copy).
+        h = hashlib.sha256()
+        buf = bytearray(CHUNK_SIZE)
+        view = memoryview(buf)
         while True:
-            b = f.read(CHUNK_SIZE)
-            if not b:
+            n = f.readinto(buf)
+            if not n:
                 break
-            h.update(b)
-    return h.hexdigest()
+            h.update(view[:n])
+        return h.hexdigest()
 
 def sha256_bytes(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
+def sha256_files(paths: list[Path]) -> list[str]:
+    # Hash independent files concurrently; hashlib releases the GIL during
+    # update, so threads scale with cores. Order of results matches input.
+    if len(paths) <= 1:
+        return [sha256_file(p) for p in paths]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+        return list(ex.map(sha256_file, paths))
+
 @dataclass(frozen=True)
 class CasPaths:
     root: Path  # repo root
@@ -45,7 +65,51 @@ def store_blob(src: Path, cas: CasPaths, digest: str) -> Path:
 
     # Copy bytes verbatim; determinism = byte identity.
     # Use replace-atomic temp -> rename to avoid partial writes.
+    # shutil.copyfile uses the kernel fast-copy path (sendfile /
+    # copy_file_range) so the payload never transits Python memory.
+    # NOTE: do not hardlink src into the CAS — src is a mutable user
+    # file, and sharing its inode would let later edits rewrite the
+    # stored object.
     tmp = dst.with_suffix(".tmp")
-    tmp.write_bytes(src.read_bytes())
+    shutil.copyfile(src, tmp)
     tmp.replace(dst)
     return dst
+
+def hash_and_store(src: Path, cas: CasPaths) -> str:
+    """Hash src and store it as a CAS blob in one read pass.
+
+    Equivalent to sha256_file(src) + store_blob(src, cas, digest) but the
+    file's bytes are read once: each chunk feeds the hasher and the temp
+    file together. The temp file is renamed to the digest-derived object
+    path only after the full digest is known, preserving the atomic
+    temp -> rename contract of store_blob.
+    """
+    cas.objects_dir.mkdir(parents=True, exist_ok=True)
+    tmp = cas.objects_dir / f".ingest-{os.getpid()}-{src.name}.tmp"
+
+    h = hashlib.sha256()
+    buf = bytearray(CHUNK_SIZE)
+    view = memoryview(buf)
+    try:
+        with src.open("rb", buffering=0) as f, tmp.open("wb") as out:
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                h.update(view[:n])
+                out.write(view[:n])
+        digest = h.hexdigest()
+
+        dst = cas.object_path(digest)
+        if dst.exists():
+            tmp.unlink()
+            return digest
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp.replace(dst)
+        return digest
+    finally:
+        if tmp.exists():
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
@@ -1,20 +1,20 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict
-from .locks import ingest_session_lock, ingest_session_lock_enabled
 
+# Heavy submodules (replay pulls subprocess/tempfile, locks pulls fcntl,
+# ...) are imported inside the command handlers so cheap invocations
+# like `ledger hash` and `ledger refs get` don't pay for them at startup.
 
-from .cas import CasPaths, sha256_file, sha256_bytes, store_blob
-from .manifest import Node, Transform, write_node_manifest
-from .replay import replay_node
-from .verify import verify_node, verify_reachable
-
-def repo_root_from_cwd() -> Path:
+@functools.lru_cache(maxsize=16)
+def _repo_root_for(cwd: str) -> Path:
     # Simple heuristic: walk up until we find 'ledger/' directory.
-    p = Path.cwd().resolve()
+    p = Path(cwd).resolve()
     for _ in range(20):
         if (p / "ledger").exists():
             return p
@@ -23,7 +23,20 @@ def repo_root_from_cwd() -> Path:
         p = p.parent
     raise SystemExit("Could not find repo root (missing ./ledger directory). Run inside the repo.")
 
+def repo_root_from_cwd() -> Path:
+    # LEDGER_REPO_ROOT short-circuits discovery entirely (useful for
+    # scripts that invoke the CLI thousands of times from one repo).
+    env = os.environ.get("LEDGER_REPO_ROOT")
+    if env:
+        root = Path(env).resolve()
+        if not (root / "ledger").exists():
+            raise SystemExit(f"LEDGER_REPO_ROOT has no ./ledger directory: {root}")
+        return root
+    return _repo_root_for(os.getcwd())
+
 def cmd_hash(args: argparse.Namespace) -> int:
+    from .cas import sha256_file
+
     p = Path(args.path)
     if not p.exists():
         raise SystemExit(f"no such file: {p}")
@@ -31,24 +44,30 @@ def cmd_hash(args: argparse.Namespace) -> int:
     return 0
 
 def cmd_ingest(args: argparse.Namespace) -> int:
+    from .cas import CasPaths, hash_and_store, sha256_bytes, sha256_file, store_blob
+    from .locks import ingest_session_lock, ingest_session_lock_enabled, ingest_shard_for
+    from .manifest import Node, Transform, write_node_manifest
+
     repo_root = repo_root_from_cwd()
     src = Path(args.path)
     if not src.exists():
         raise SystemExit(f"no such file: {src}")
 
-    artifact_id = sha256_file(src)
+    # Single read pass: the artifact is hashed and streamed into the CAS
+    # together. The blob write is an atomic temp -> rename keyed by the
+    # content digest, so it is safe outside the session lock; only the
+    # remaining writes (transform blob + node manifest) take the lock.
     cas = CasPaths.from_repo_root(repo_root)
-    store_blob(src, cas, artifact_id)
+    artifact_id = hash_and_store(src, cas)
 
     # Transform digest: by default hash the provided transform string (stable identifier),
     # OR if a file path is provided via --transform-file, hash that file's bytes.
+    tf: Path | None = None
     if args.transform_file:
         tf = Path(args.transform_file)
         if not tf.exists():
             raise SystemExit(f"no such transform file: {tf}")
         transform_digest = sha256_file(tf)
-        # Store transform definition in the CAS so it can be replayed by digest.
-        store_blob(tf, cas, transform_digest)
         transform_name = args.transform or tf.name
     else:
         transform_name = args.transform or "unspecified"
@@ -72,12 +91,27 @@ def cmd_ingest(args: argparse.Namespace) -> int:
         ),
         meta={"note": args.note} if args.note else None,
     )
-    write_node_manifest(repo_root, node)
+
+    def _do_ingest() -> None:
+        if tf is not None:
+            # Store transform definition in the CAS so it can be replayed by digest.
+            store_blob(tf, cas, transform_digest)
+        write_node_manifest(repo_root, node)
+
+    if ingest_session_lock_enabled(cli_no_session_lock=bool(args.no_session_lock)):
+        # Lock striped by artifact-id prefix: concurrent ingests of
+        # different artifacts do not serialize on one global mutex.
+        with ingest_session_lock(repo_root, shard=ingest_shard_for(artifact_id)):
+            _do_ingest()
+    else:
+        _do_ingest()
 
     print(artifact_id)
     return 0
 
 def cmd_verify(args: argparse.Namespace) -> int:
+    from .verify import verify_node
+
     repo_root = repo_root_from_cwd()
     r = verify_node(repo_root, args.id, replay=args.replay)
     if r.ok:
@@ -88,8 +122,10 @@ def cmd_verify(args: argparse.Namespace) -> int:
     return 2
 
 def cmd_verify_reachable(args: argparse.Namespace) -> int:
+    from .verify import verify_reachable
+
     repo_root = repo_root_from_cwd()
-    r = verify_reachable(repo_root, args.id, replay=args.replay)
+    r = verify_reachable(repo_root, args.id, replay=args.replay, jobs=args.jobs)
     if r.ok:
         print("OK")
         return 0
@@ -99,6 +135,8 @@ def cmd_verify_reachable(args: argparse.Namespace) -> int:
 
 
 def cmd_replay(args: argparse.Namespace) -> int:
+    from .replay import replay_node
+
     repo_root = repo_root_from_cwd()
     wd = Path(args.workdir).resolve() if args.workdir else None
     r = replay_node(repo_root, args.id, workdir=wd, keep=args.keep)
@@ -123,20 +161,6 @@ def cmd_refs_get(args: argparse.Namespace) -> int:
         raise SystemExit(f"missing ref: {refp}")
     print(refp.read_text(encoding="utf-8").strip())
     return 0
-def _do_ingest() -> str:
-        # existing ingest logic that ends with:
-        # write_node_manifest(repo_root, node)
-        # return artifact_id
-    return artifact_id
-
-    if ingest_session_lock_enabled(cli_no_session_lock=bool(getattr(args, "no_session_lock", False))):
-        with ingest_session_lock(repo_root):
-            artifact_id = _do_ingest()
-    else:
-        artifact_id = _do_ingest()
-
-    print(artifact_id)
-    return 0
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="ledger", description="Epistemic Ledger CLI (minimal kernel).")
@@ -191,6 +215,12 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Also replay derivations for reachable nodes.",
     )
+    p_vr.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Verify reachable nodes with this many threads (default: 1).",
+    )
     p_vr.set_defaults(fn=cmd_verify_reachable)
 
     p_rep = sub.add_parser("replay", help="Replay a node derivation and verify output hash.")
@@ -220,7 +250,27 @@ def build_parser() -> argparse.ArgumentParser:
 
     return p
 
+def _fast_dispatch(argv: list[str]) -> int | None:
+    # Hot read-only commands skip argparse entirely: building the full
+    # subparser tree costs more than hashing a small file. Anything with
+    # flags (incl. --help) falls through to the real parser.
+    if len(argv) == 2 and argv[0] == "hash" and not argv[1].startswith("-"):
+        return cmd_hash(argparse.Namespace(path=argv[1]))
+    if (
+        len(argv) == 3
+        and argv[0] == "refs"
+        and argv[1] == "get"
+        and not argv[2].startswith("-")
+    ):
+        return cmd_refs_get(argparse.Namespace(name=argv[2]))
+    return None
+
 def main() -> None:
+    import sys
+
+    rc = _fast_dispatch(sys.argv[1:])
+    if rc is not None:
+        raise SystemExit(rc)
     p = build_parser()
     args = p.parse_args()
     raise SystemExit(args.fn(args))
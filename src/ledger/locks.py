@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import atexit
 import os
+import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator
+from typing import IO, Dict, Iterator, Tuple
 
 
 def _truthy(v: str) -> bool:
@@ -16,14 +18,96 @@ def _falsey(v: str) -> bool:
     return s in ("0", "false", "no", "n", "off")
 
 
-def ingest_session_lock_path(repo_root: Path) -> Path:
+# Default shard count for ingest lock striping (env-overridable).
+NUM_INGEST_LOCK_SHARDS = 64
+
+
+def _num_ingest_lock_shards() -> int:
+    v = os.environ.get("LEDGER_INGEST_LOCK_SHARDS")
+    if v is None:
+        return NUM_INGEST_LOCK_SHARDS
+    try:
+        n = int(v)
+    except ValueError:
+        return NUM_INGEST_LOCK_SHARDS
+    return n if n >= 1 else NUM_INGEST_LOCK_SHARDS
+
+
+def ingest_shard_for(artifact_id: str) -> int:
+    """Map an artifact id (sha256 hex) to an ingest lock shard."""
+    try:
+        return int(artifact_id[:2], 16) % _num_ingest_lock_shards()
+    except ValueError:
+        return 0
+
+
+def ingest_session_lock_path(repo_root: Path, shard: int | None = None) -> Path:
     """
     Repo-wide ingest-session lock path.
 
     Stored under ledger/ so the lock is per-repo/worktree (not per cwd).
     Recommended to ignore in git: ledger/.locks/
+
+    With a shard, returns a striped lock path so ingests of artifacts in
+    different shards do not serialize on one global mutex.
     """
-    return Path(repo_root) / "ledger" / ".locks" / "ingest.lock"
+    locks_dir = Path(repo_root) / "ledger" / ".locks"
+    if shard is None:
+        return locks_dir / "ingest.lock"
+    return locks_dir / f"ingest-{shard:02x}.lock"
+
+# Per-process cache of open lock-file handles, so tight ingest loops
+# don't pay an open/close pair per acquisition. flock/msvcrt locks are
+# FD-associated, but a *shared* FD is invisible to them: a second
+# flock(LOCK_EX) on an already-locked FD succeeds immediately, so each
+# cached handle is paired with a threading.Lock that serializes threads
+# of this process for the duration of the OS lock. file_range_lock must
+# NOT use this cache — its OFD locks contend per open file description
+# (a shared fd would merge them), and its lockf fallback's record locks
+# are dropped when *any* fd for the file is closed.
+_lock_fd_cache: Dict[str, Tuple[IO[bytes], threading.Lock]] = {}
+_lock_fd_cache_mutex = threading.Lock()
+
+
+def _close_cached_lock_fds() -> None:
+    with _lock_fd_cache_mutex:
+        for f, _ in _lock_fd_cache.values():
+            try:
+                f.close()
+            except Exception:
+                pass
+        _lock_fd_cache.clear()
+
+
+atexit.register(_close_cached_lock_fds)
+
+
+def _open_lock_file(lock_path: Path) -> Tuple[IO[bytes], threading.Lock]:
+    key = str(lock_path)
+    with _lock_fd_cache_mutex:
+        entry = _lock_fd_cache.get(key)
+        if entry is not None and not entry[0].closed:
+            return entry
+
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        f = lock_path.open("a+b")
+
+        # Ensure at least 1 byte exists for Windows range locks. flock on
+        # POSIX locks the whole file regardless of size, so skip the
+        # seek/write/flush round-trip there.
+        if os.name != "posix":
+            try:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    f.write(b"\0")
+                    f.flush()
+            except Exception:
+                pass
+
+        entry = (f, threading.Lock())
+        _lock_fd_cache[key] = entry
+        return entry
+
 
 @contextmanager
 def file_lock(lock_path: Path) -> Iterator[None]:
@@ -33,22 +117,14 @@ def file_lock(lock_path: Path) -> Iterator[None]:
     POSIX: fcntl.flock
     Windows: msvcrt.locking (1-byte range lock)
 
-    Lock lifetime is tied to the open FD; crashes release locks.
+    Lock lifetime is tied to the open FD; crashes release locks. The FD
+    itself is cached per process (closed at exit) so repeated
+    acquisitions only cost the lock/unlock syscalls; a per-path thread
+    mutex keeps threads sharing the FD mutually exclusive too.
     """
-    lock_path = Path(lock_path)
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
-
-    f = lock_path.open("a+b")
-    try:
-        # Ensure at least 1 byte exists for Windows range locks.
-        try:
-            f.seek(0, os.SEEK_END)
-            if f.tell() == 0:
-                f.write(b"\0")
-                f.flush()
-        except Exception:
-            pass
+    f, mutex = _open_lock_file(Path(lock_path))
 
+    with mutex:
         if os.name == "posix":
             import fcntl  # type: ignore
 
@@ -73,6 +149,76 @@ def file_lock(lock_path: Path) -> Iterator[None]:
                     msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
                 except Exception:
                     pass
+
+
+@contextmanager
+def file_range_lock(lock_path: Path, offset: int, length: int = 1) -> Iterator[None]:
+    """
+    Cross-process exclusive advisory lock over a byte range.
+
+    POSIX: open-file-description locks (fcntl F_OFD_SETLKW) where the
+      platform has them, else fcntl.lockf (POSIX record locks)
+    Windows: msvcrt.locking on the given range
+
+    Distinct ranges of the same file do not contend, so callers can key
+    an offset by shard and run disjoint critical sections in parallel.
+
+    OFD locks are owned by this call's open file description, not the
+    process: two threads taking the same range genuinely contend, and
+    closing this call's fd releases only this call's lock. The lockf
+    fallback has neither property — record locks are process-owned
+    (threads of one process never exclude each other) and are dropped
+    when *any* fd for the file is closed — so on platforms without OFD
+    locks this API is cross-process-only: do not call it from more than
+    one thread of a process at a time.
+    """
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    f = lock_path.open("a+b")
+    try:
+        if os.name == "posix":
+            import fcntl  # type: ignore
+
+            if hasattr(fcntl, "F_OFD_SETLKW"):
+                import struct
+
+                # struct flock: l_type, l_whence, l_start, l_len (l_pid
+                # and trailing padding zeroed). "hhllhh" matches glibc's
+                # layout on LP64 platforms.
+                def _flk(l_type: int) -> bytes:
+                    return struct.pack("hhllhh", l_type, os.SEEK_SET, offset, length, 0, 0)
+
+                fcntl.fcntl(f.fileno(), fcntl.F_OFD_SETLKW, _flk(fcntl.F_WRLCK))
+                try:
+                    yield
+                finally:
+                    try:
+                        fcntl.fcntl(f.fileno(), fcntl.F_OFD_SETLK, _flk(fcntl.F_UNLCK))
+                    except Exception:
+                        pass
+            else:
+                fcntl.lockf(f.fileno(), fcntl.LOCK_EX, length, offset)
+                try:
+                    yield
+                finally:
+                    try:
+                        fcntl.lockf(f.fileno(), fcntl.LOCK_UN, length, offset)
+                    except Exception:
+                        pass
+        else:
+            import msvcrt  # type: ignore
+
+            f.seek(offset)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, length)
+            try:
+                yield
+            finally:
+                try:
+                    f.seek(offset)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, length)
+                except Exception:
+                    pass
     finally:
         try:
             f.close()
@@ -81,9 +227,12 @@ def file_lock(lock_path: Path) -> Iterator[None]:
 
 
 @contextmanager
-def ingest_session_lock(repo_root: Path) -> Iterator[None]:
-    """Convenience wrapper for the repo-wide ingest-session lock."""
-    with file_lock(ingest_session_lock_path(repo_root)):
+def ingest_session_lock(repo_root: Path, shard: int | None = None) -> Iterator[None]:
+    """Convenience wrapper for the repo-wide ingest-session lock.
+
+    With a shard (see ingest_shard_for), locks only that stripe.
+    """
+    with file_lock(ingest_session_lock_path(repo_root, shard)):
         yield
 
 
@@ -5,7 +5,17 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List
 
-@dataclass(frozen=True)
+try:
+    # Optional accelerator for the parse-heavy verify/replay paths.
+    # Used for decoding only: encoded manifest bytes stay on the stdlib
+    # encoder so on-disk bytes do not depend on which codec is installed.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+# slots=True: fixed attribute storage, no per-instance __dict__ — keeps
+# Node/Transform cheap when many are alive at once (batch ingest, DAG walks).
+@dataclass(frozen=True, slots=True)
 class Transform:
     name: str
     digest: str
@@ -16,7 +26,7 @@ class Transform:
     runner: List[str] | None = None
     env_digest: str | None = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Node:
     id: str
     parents: List[str]
@@ -45,7 +55,7 @@ class Node:
 def node_manifest_path(repo_root: Path, node_id: str) -> Path:
     return repo_root / "ledger" / "nodes" / f"{node_id}.json"
 
-def write_node_manifest(repo_root: Path, node: Node) -> Path:
+def write_node_manifest(repo_root: Path, node: Node, pretty: bool = False) -> Path:
     p = node_manifest_path(repo_root, node.id)
     p.parent.mkdir(parents=True, exist_ok=True)
 
@@ -54,10 +64,19 @@ def write_node_manifest(repo_root: Path, node: Node) -> Path:
         raise FileExistsError(f"Node manifest already exists: {p}")
 
     payload = node.to_dict()
-    txt = json.dumps(payload, indent=2, sort_keys=True) + "\n"
+    # Compact canonical form by default: manifests are machine-read on
+    # the hot verify path; pass pretty=True when a human needs to stare
+    # at one.
+    if pretty:
+        txt = json.dumps(payload, indent=2, sort_keys=True) + "\n"
+    else:
+        txt = json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n"
     p.write_text(txt, encoding="utf-8")
     return p
 
 def read_node_manifest(repo_root: Path, node_id: str) -> Dict[str, Any]:
     p = node_manifest_path(repo_root, node_id)
-    return json.loads(p.read_text(encoding="utf-8"))
+    data = p.read_bytes()
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
 import subprocess
 import tempfile
 from dataclasses import dataclass
@@ -21,6 +23,97 @@ def _canonical_json(obj: Any) -> str:
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
+def _hardlink_materialization_enabled() -> bool:
+    """Opt-in: LEDGER_REPLAY_HARDLINK=true links CAS objects into workdirs.
+
+    Off by default for safety: the transform subprocess has write access
+    to the workdir, and a misbehaving transform writing through a
+    hardlink would corrupt the immutable CAS object. Enable only for
+    trusted transforms when replaying large artifacts.
+    """
+    v = os.environ.get("LEDGER_REPLAY_HARDLINK")
+    if v is None:
+        return False
+    return v.strip().lower() in ("1", "true", "yes", "y", "on")
+
+
+# Trusted in-process transforms.
+#
+# Replaying via subprocess pays interpreter startup per node. Transforms
+# that live in this repo's transforms/ directory are code we already
+# trust (they are reviewed and versioned alongside the replay host), so
+# when a node's transform digest matches the bytes of one of those files
+# we import it and call its run() directly instead of shelling out.
+# Keyed by digest, so a stale or edited file simply stops matching and
+# replay falls back to the subprocess path. Cache is per repo root.
+_trusted_transforms: Dict[str, Dict[str, Any]] = {}
+
+
+def _trusted_transform_run(repo_root: Path, digest: str) -> Any | None:
+    """run() callable for a repo transform whose bytes hash to digest, else None."""
+    key = str(repo_root)
+    cache = _trusted_transforms.get(key)
+    if cache is None:
+        cache = {}
+        tdir = Path(repo_root) / "transforms"
+        if tdir.is_dir():
+            for f in sorted(tdir.glob("*.py")):
+                try:
+                    cache[sha256_file(f)] = f
+                except OSError:
+                    continue
+        _trusted_transforms[key] = cache
+
+    entry = cache.get(digest)
+    if entry is None:
+        return None
+    if isinstance(entry, Path):
+        import importlib.util
+
+        spec = importlib.util.spec_from_file_location(f"_ledger_transform_{digest[:12]}", entry)
+        if spec is None or spec.loader is None:
+            cache[digest] = None
+            return None
+        mod = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(mod)
+        except Exception:
+            cache[digest] = None
+            return None
+        entry = getattr(mod, "run", None) if callable(getattr(mod, "run", None)) else None
+        cache[digest] = entry
+    return entry
+
+
+# How much of a transform's log to quote in error messages.
+_LOG_TAIL_BYTES = 16 * 1024
+
+
+def _tail_text(log_path: Path) -> str:
+    """Last _LOG_TAIL_BYTES of a log file, decoded leniently."""
+    try:
+        size = log_path.stat().st_size
+        with log_path.open("rb") as f:
+            if size > _LOG_TAIL_BYTES:
+                f.seek(size - _LOG_TAIL_BYTES)
+            data = f.read()
+    except OSError:
+        return ""
+    return data.decode("utf-8", errors="replace").strip("\n")
+
+
+def _materialize(src: Path, dst: Path) -> None:
+    """Materialize an immutable CAS object at dst (byte-for-byte)."""
+    if _hardlink_materialization_enabled():
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            # Cross-device, unsupported filesystem, etc. — fall back.
+            pass
+    shutil.copyfile(src, dst)
+
+
 @dataclass(frozen=True)
 class ReplayResult:
     ok: bool
@@ -29,7 +122,13 @@ class ReplayResult:
     workdir: Path | None = None
 
 
-def replay_node(repo_root: Path, node_id: str, workdir: Path | None = None, keep: bool = False) -> ReplayResult:
+def replay_node(
+    repo_root: Path,
+    node_id: str,
+    workdir: Path | None = None,
+    keep: bool = False,
+    manifest: Dict[str, Any] | None = None,
+) -> ReplayResult:
     """Replay a node derivation.
 
     Contract (v0, minimal):
@@ -52,7 +151,9 @@ def replay_node(repo_root: Path, node_id: str, workdir: Path | None = None, keep
 
     errors: List[str] = []
 
-    m = read_node_manifest(repo_root, node_id)
+    # `manifest` mirrors verify_node: callers that already parsed the
+    # node manifest pass it in and skip a second JSON parse.
+    m = manifest if manifest is not None else read_node_manifest(repo_root, node_id)
     parents = m.get("parents", [])
     if not isinstance(parents, list):
         return ReplayResult(False, ["manifest.parents not a list"])
@@ -136,8 +237,7 @@ def replay_node(repo_root: Path, node_id: str, workdir: Path | None = None, keep
                 errors.append(f"missing parent object: {parent_obj}")
                 continue
             dst = parents_dir / f"{i:03d}_{pid}.bin"
-            # Byte-for-byte materialization.
-            dst.write_bytes(parent_obj.read_bytes())
+            _materialize(parent_obj, dst)
             parents_manifest.append({"index": i, "id": pid, "path": dst.name})
 
         if errors:
@@ -149,11 +249,38 @@ def replay_node(repo_root: Path, node_id: str, workdir: Path | None = None, keep
         )
         (wd / "params.json").write_text(_canonical_json(params) + "\n", encoding="utf-8")
 
-        transform_path = wd / f"transform_{transform_digest}.py"
-        transform_path.write_bytes(transform_obj.read_bytes())
-
         out_path = wd / "out.bin"
 
+        # Trusted repo transforms run in-process, skipping interpreter
+        # startup; anything else goes through the subprocess contract.
+        # Note the in-process path ignores manifest.transform.runner:
+        # dispatch is by digest, and a match means the bytes are a
+        # reviewed repo transform this host calls directly.
+        trusted_run = _trusted_transform_run(repo_root, transform_digest)
+        if trusted_run is not None:
+            try:
+                trusted_run(parents_manifest, parents_dir, params, out_path)
+            except Exception as e:
+                return ReplayResult(
+                    False, [f"transform failed (in-process): {e!r}"], workdir=wd
+                )
+            if not out_path.exists():
+                return ReplayResult(
+                    False, ["transform produced no output (missing out.bin)"], workdir=wd
+                )
+            out_digest = sha256_file(out_path)
+            if out_digest != node_id:
+                return ReplayResult(
+                    False,
+                    [f"derivation mismatch: expected {node_id}, got {out_digest}"],
+                    output_digest=out_digest,
+                    workdir=wd,
+                )
+            return ReplayResult(True, [], output_digest=out_digest, workdir=wd)
+
+        transform_path = wd / f"transform_{transform_digest}.py"
+        _materialize(transform_obj, transform_path)
+
         cmd = [
             *runner_argv,
             str(transform_path),
@@ -167,13 +294,22 @@ def replay_node(repo_root: Path, node_id: str, workdir: Path | None = None, keep
             str(out_path),
         ]
 
-        proc = subprocess.run(cmd, cwd=str(wd), text=True, capture_output=True)
+        # Stream transform output straight to files in the workdir rather
+        # than buffering entire stdout/stderr in this process; verbose
+        # transforms no longer spike parent memory, and --keep leaves the
+        # logs behind for post-mortem inspection.
+        stdout_log = wd / "stdout.log"
+        stderr_log = wd / "stderr.log"
+        with stdout_log.open("wb") as fout, stderr_log.open("wb") as ferr:
+            proc = subprocess.run(cmd, cwd=str(wd), stdout=fout, stderr=ferr)
         if proc.returncode != 0:
             errors.append(f"transform failed (exit={proc.returncode})")
-            if proc.stdout.strip():
-                errors.append("stdout:\n" + proc.stdout.rstrip("\n"))
-            if proc.stderr.strip():
-                errors.append("stderr:\n" + proc.stderr.rstrip("\n"))
+            out_tail = _tail_text(stdout_log)
+            err_tail = _tail_text(stderr_log)
+            if out_tail:
+                errors.append("stdout:\n" + out_tail)
+            if err_tail:
+                errors.append("stderr:\n" + err_tail)
             return ReplayResult(False, errors, workdir=wd)
 
         if not out_path.exists():
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Set
+from typing import Any, Dict, List, Set
 
 from .cas import CasPaths, sha256_file
 from .manifest import node_manifest_path, read_node_manifest
@@ -13,7 +13,14 @@ class VerifyResult:
     ok: bool
     errors: List[str]
 
-def verify_node(repo_root: Path, node_id: str, replay: bool = False) -> VerifyResult:
+def verify_node(
+    repo_root: Path,
+    node_id: str,
+    replay: bool = False,
+    manifest: Dict[str, Any] | None = None,
+) -> VerifyResult:
+    # `manifest` lets callers that already parsed the node manifest (e.g.
+    # verify_reachable) pass it in and skip a second JSON parse.
     errors: List[str] = []
 
     # 1) manifest exists
@@ -32,7 +39,7 @@ def verify_node(repo_root: Path, node_id: str, replay: bool = False) -> VerifyRe
             errors.append(f"object hash mismatch: expected {node_id}, got {digest}")
 
     # 3) parents reachable (manifest exists)
-    m = read_node_manifest(repo_root, node_id)
+    m = manifest if manifest is not None else read_node_manifest(repo_root, node_id)
     parents = m.get("parents", [])
     if not isinstance(parents, list):
         errors.append("manifest.parents not a list")
@@ -48,36 +55,72 @@ def verify_node(repo_root: Path, node_id: str, replay: bool = False) -> VerifyRe
 
     # 4) optional derivation replay (stronger verification)
     if replay and len(errors) == 0:
-        rr = replay_node(repo_root, node_id)
+        rr = replay_node(repo_root, node_id, manifest=m)
         if not rr.ok:
             errors.extend([f"replay: {e}" for e in rr.errors])
 
     return VerifyResult(ok=(len(errors) == 0), errors=errors)
 
-def verify_reachable(repo_root: Path, root_id: str, replay: bool = False) -> VerifyResult:
-    # DFS with memoization; validates all reachable nodes.
+def verify_reachable(
+    repo_root: Path, root_id: str, replay: bool = False, jobs: int = 1
+) -> VerifyResult:
+    # Phase 1 — DFS over manifests to collect the reachable set.
+    # Dedup happens at push time so a high-fan-in DAG never queues (or
+    # re-verifies) the same ancestor twice; each unique node is visited
+    # exactly once. Manifests are parsed once here and shared with
+    # verify_node below.
     errors: List[str] = []
-    seen: Set[str] = set()
+    seen: Set[str] = {root_id}
     stack: List[str] = [root_id]
+    order: List[str] = []
+    manifests: Dict[str, Dict[str, Any] | None] = {}
+    manifest_errs: Dict[str, Exception] = {}
 
     while stack:
         nid = stack.pop()
-        if nid in seen:
-            continue
-        seen.add(nid)
-
-        r = verify_node(repo_root, nid, replay=replay)
-        if not r.ok:
-            errors.extend([f"{nid}: {e}" for e in r.errors])
+        order.append(nid)
 
+        m: Dict[str, Any] | None = None
         try:
             m = read_node_manifest(repo_root, nid)
-            parents = m.get("parents", [])
-            if isinstance(parents, list):
-                for p in parents:
-                    if isinstance(p, str) and len(p) == 64:
-                        stack.append(p)
         except Exception as e:
-            errors.append(f"{nid}: failed reading manifest: {e}")
+            manifest_errs[nid] = e
+        manifests[nid] = m
+
+        if m is None:
+            continue
+
+        parents = m.get("parents", [])
+        if isinstance(parents, list):
+            for p in parents:
+                if isinstance(p, str) and len(p) == 64 and p not in seen:
+                    seen.add(p)
+                    stack.append(p)
+
+    # Phase 2 — verify every reachable node. Nodes are independent, and
+    # hashing releases the GIL, so jobs > 1 fans them out over threads.
+    # Error output stays deterministic: results are reported in visit
+    # order regardless of completion order.
+    def _verify(nid: str) -> VerifyResult:
+        m = manifests[nid]
+        if m is None:
+            # Manifest was missing or unparseable in phase 1; reported
+            # from manifest_errs below. Re-reading here would raise.
+            return VerifyResult(False, [])
+        return verify_node(repo_root, nid, replay=replay, manifest=m)
+
+    if jobs > 1 and len(order) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=jobs) as ex:
+            results = list(ex.map(_verify, order))
+    else:
+        results = [_verify(nid) for nid in order]
+
+    for nid, r in zip(order, results):
+        if not r.ok:
+            errors.extend([f"{nid}: {e}" for e in r.errors])
+        if manifests[nid] is None:
+            errors.append(f"{nid}: failed reading manifest: {manifest_errs[nid]}")
 
     return VerifyResult(ok=(len(errors) == 0), errors=errors)
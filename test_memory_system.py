@@ -113,6 +113,19 @@ def test_memory_store_hashing():
     assert retrieved2.parents == (hash1,)
 
 
+def test_put_many_matches_put():
+    """Test that put_many returns the same hashes as sequential put calls."""
+    store_a = MemoryStore()
+    store_b = MemoryStore()
+
+    nodes = [MemNode(data=b"one", parents=()), MemNode(data=b"two", parents=())]
+    expected = [store_a.put(MemNode(data=n.data, parents=n.parents)) for n in nodes]
+
+    hashes = store_b.put_many(nodes)
+    assert hashes == expected
+    assert all(store_b.contains(h) for h in hashes)
+
+
 def test_multiple_steps_with_missing_node():
     """Test that replay fails on first missing node in a chain."""
     memory = MemoryStore()
@@ -0,0 +1,53 @@
+"""Child-process entrypoints for the lock contention tests.
+
+Kept in a dedicated module (instead of the test file) so a forkserver
+context can preload just ledger.locks and these few functions rather
+than re-importing the whole test module in every spawned child.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from ledger.locks import file_range_lock, ingest_session_lock, ingest_session_lock_path
+
+
+def holder(repo: str, ready, ctrl) -> None:
+    repo_root = Path(repo)
+    with ingest_session_lock(repo_root):
+        ready.send("LOCKED")
+        msg = ctrl.recv()
+        assert msg == "RELEASE"
+
+
+def waiter(repo: str, out) -> None:
+    repo_root = Path(repo)
+    with ingest_session_lock(repo_root):
+        out.send("ACQUIRED")
+
+
+def prober(repo: str, out) -> None:
+    # Non-blocking acquisition attempt: proves contention without the
+    # timing slop of a poll-with-timeout in the parent.
+    import fcntl
+
+    p = ingest_session_lock_path(Path(repo))
+    with p.open("a+b") as f:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            out.send("BLOCKED")
+            return
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        out.send("UNEXPECTED")
+
+
+def range_holder(lock_file: str, offset: int, ready, ctrl) -> None:
+    with file_range_lock(Path(lock_file), offset):
+        ready.send("LOCKED")
+        assert ctrl.recv() == "RELEASE"
+
+
+def range_waiter(lock_file: str, offset: int, out) -> None:
+    with file_range_lock(Path(lock_file), offset):
+        out.send("ACQUIRED")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+
+from canon.ids import canon_json_bytes, is_sha256_prefixed, sha256_prefixed
+
+
+def _stdlib_canon(obj) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def test_canon_json_bytes_matches_frozen_encoding():
+    # Byte-level lock on the Sprint-1 canonical form. Any alternative
+    # encoder backend must reproduce these bytes exactly (note: orjson
+    # does not — it emits "1e-9" where the frozen form is "1e-09").
+    objs = [
+        {},
+        {"b": 1, "a": [1, 2, {"z": "ü", "y": None}], "c": False},
+        {"unicode": "héllo ∆", "nested": {"k": [1.5, 2.25, -0.0]}},
+        {"f": 1e-9, "n": 2**53},
+        {"v": 1, "node_type": "root_entropy", "root_hash": "ab" * 32},
+    ]
+    for obj in objs:
+        assert canon_json_bytes(obj) == _stdlib_canon(obj)
+
+
+def test_sha256_prefixed_roundtrip():
+    digest = sha256_prefixed(canon_json_bytes({"a": 1}))
+    assert is_sha256_prefixed(digest)
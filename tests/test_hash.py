@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from ledger.cas import sha256_bytes
+import tempfile
+from pathlib import Path
+
+from ledger.cas import sha256_bytes, sha256_file, sha256_files
 
 def test_sha256_bytes_stable():
     assert sha256_bytes(b"abc") == "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+
+def test_sha256_files_matches_serial():
+    with tempfile.TemporaryDirectory() as td:
+        paths = []
+        for i in range(4):
+            p = Path(td) / f"f{i}.bin"
+            p.write_bytes(b"payload-%d" % i)
+            paths.append(p)
+        assert sha256_files(paths) == [sha256_file(p) for p in paths]
+        assert sha256_files([]) == []
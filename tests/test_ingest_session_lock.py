@@ -1,32 +1,58 @@
 from __future__ import annotations
 
 import multiprocessing as mp
+import sys
 import tempfile
 from pathlib import Path
 
 from ledger.locks import ingest_session_lock, ingest_session_lock_path
 
+import _lock_workers
+
+
+def _mp_context():
+    # forkserver gives spawn semantics (fresh child state) but forks from
+    # a server that already imported the worker module, skipping the
+    # per-child interpreter + import cost. Windows only has spawn.
+    if sys.platform == "win32":
+        return mp.get_context("spawn")
+    ctx = mp.get_context("forkserver")
+    ctx.set_forkserver_preload(["_lock_workers"])
+    return ctx
+
 
 def _init_repo(root: Path) -> None:
     (root / "ledger").mkdir(parents=True, exist_ok=True)
 
 
-def _holder(repo: str, ready, ctrl) -> None:
-    repo_root = Path(repo)
-    with ingest_session_lock(repo_root):
-        ready.send("LOCKED")
-        msg = ctrl.recv()
-        assert msg == "RELEASE"
+def test_file_range_lock_disjoint_ranges_do_not_contend() -> None:
+    ctx = _mp_context()
+    with tempfile.TemporaryDirectory() as td:
+        lock_file = str(Path(td) / "shards.lock")
 
+        ready_parent, ready_child = ctx.Pipe()
+        ctrl_parent, ctrl_child = ctx.Pipe()
+        out_parent, out_child = ctx.Pipe()
 
-def _waiter(repo: str, out) -> None:
-    repo_root = Path(repo)
-    with ingest_session_lock(repo_root):
-        out.send("ACQUIRED")
+        p1 = ctx.Process(target=_lock_workers.range_holder, args=(lock_file, 0, ready_child, ctrl_child))
+        p1.start()
+        assert ready_parent.recv() == "LOCKED"
+
+        # A different byte range acquires immediately while range 0 is held.
+        p2 = ctx.Process(target=_lock_workers.range_waiter, args=(lock_file, 1, out_child))
+        p2.start()
+        assert out_parent.poll(5.0) is True
+        assert out_parent.recv() == "ACQUIRED"
+        p2.join(timeout=5)
+
+        ctrl_parent.send("RELEASE")
+        p1.join(timeout=5)
+        assert p1.exitcode == 0
+        assert p2.exitcode == 0
 
 
 def test_ingest_session_lock_blocks_other_processes() -> None:
-    ctx = mp.get_context("spawn")
+    ctx = _mp_context()
     with tempfile.TemporaryDirectory() as td:
         repo_root = Path(td)
         _init_repo(repo_root)
@@ -35,6 +61,10 @@ def test_ingest_session_lock_blocks_other_processes() -> None:
         # OS-agnostic check of suffix parts.
         assert lp.parts[-3:] == ("ledger", ".locks", "ingest.lock")
 
+        # Striped variant lives next to the global lock, keyed by shard.
+        sp = ingest_session_lock_path(repo_root, shard=10)
+        assert sp.parts[-3:] == ("ledger", ".locks", "ingest-0a.lock")
+
         # Directory is created on lock acquisition (advisory lock file lives here).
         with ingest_session_lock(repo_root):
             assert lp.parent.exists()
@@ -43,15 +73,21 @@ def test_ingest_session_lock_blocks_other_processes() -> None:
         ctrl_parent, ctrl_child = ctx.Pipe()
         out_parent, out_child = ctx.Pipe()
 
-        p1 = ctx.Process(target=_holder, args=(str(repo_root), ready_child, ctrl_child))
+        p1 = ctx.Process(target=_lock_workers.holder, args=(str(repo_root), ready_child, ctrl_child))
         p1.start()
         assert ready_parent.recv() == "LOCKED"
 
-        p2 = ctx.Process(target=_waiter, args=(str(repo_root), out_child))
-        p2.start()
+        # While p1 holds the lock, a non-blocking probe must fail
+        # immediately — no timing-based poll needed.
+        probe_parent, probe_child = ctx.Pipe()
+        pp = ctx.Process(target=_lock_workers.prober, args=(str(repo_root), probe_child))
+        pp.start()
+        assert probe_parent.recv() == "BLOCKED"
+        pp.join(timeout=5)
+        assert pp.exitcode == 0
 
-        # While p1 holds the lock, p2 must not acquire.
-        assert out_parent.poll(0.25) is False
+        p2 = ctx.Process(target=_lock_workers.waiter, args=(str(repo_root), out_child))
+        p2.start()
 
         # Release and ensure p2 acquires.
         ctrl_parent.send("RELEASE")
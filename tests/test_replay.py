@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -14,6 +15,22 @@ def _init_repo(root: Path) -> None:
     (root / "ledger" / "refs").mkdir(parents=True, exist_ok=True)
 
 
+def _install_trusted_transform(repo: Path, cas: CasPaths) -> str:
+    """Copy this repo's concat_parents transform into repo/transforms and the CAS.
+
+    The manifest digest then matches a transforms/*.py file byte-for-byte,
+    which is exactly what makes replay_node take the in-process path.
+    """
+    src = Path(__file__).resolve().parents[1] / "transforms" / "concat_parents.py"
+    tdir = repo / "transforms"
+    tdir.mkdir(parents=True, exist_ok=True)
+    dst = tdir / "concat_parents.py"
+    shutil.copyfile(src, dst)
+    t_id = sha256_file(dst)
+    store_blob(dst, cas, t_id)
+    return t_id
+
+
 def test_replay_ok_for_derived_node() -> None:
     with tempfile.TemporaryDirectory() as td:
         repo = Path(td)
@@ -157,3 +174,97 @@ Path(args.out).write_bytes((parents_dir / parents_manifest[0]['path']).read_byte
         rr = replay_node(repo, bad_id)
         assert not rr.ok
         assert any("derivation mismatch" in e for e in rr.errors)
+
+
+def test_replay_trusted_transform_runs_in_process() -> None:
+    with tempfile.TemporaryDirectory() as td:
+        repo = Path(td)
+        _init_repo(repo)
+        cas = CasPaths.from_repo_root(repo)
+
+        p1_path = repo / "p1.bin"
+        p2_path = repo / "p2.bin"
+        p1_path.write_bytes(b"hello")
+        p2_path.write_bytes(b"world")
+        p1_id = sha256_file(p1_path)
+        p2_id = sha256_file(p2_path)
+        store_blob(p1_path, cas, p1_id)
+        store_blob(p2_path, cas, p2_id)
+
+        admit_digest = sha256_bytes(b"admit")
+        write_node_manifest(
+            repo,
+            Node(id=p1_id, parents=[], transform=Transform(name="admit", digest=admit_digest, params={})),
+        )
+        write_node_manifest(
+            repo,
+            Node(id=p2_id, parents=[], transform=Transform(name="admit", digest=admit_digest, params={})),
+        )
+
+        t_id = _install_trusted_transform(repo, cas)
+
+        out_path = repo / "out.bin"
+        out_path.write_bytes(b"helloworld!")
+        out_id = sha256_file(out_path)
+        store_blob(out_path, cas, out_id)
+
+        write_node_manifest(
+            repo,
+            Node(
+                id=out_id,
+                parents=[p1_id, p2_id],
+                transform=Transform(
+                    name="concat",
+                    digest=t_id,
+                    params={"suffix": "!"},
+                    runner=["python3"],
+                ),
+            ),
+        )
+
+        wd = repo / "replay-wd"
+        rr = replay_node(repo, out_id, workdir=wd)
+        assert rr.ok, rr.errors
+        # The subprocess path materializes the transform script into the
+        # workdir before execing it; its absence pins in-process dispatch.
+        assert not (wd / f"transform_{t_id}.py").exists()
+
+
+def test_replay_trusted_transform_detects_mismatch() -> None:
+    with tempfile.TemporaryDirectory() as td:
+        repo = Path(td)
+        _init_repo(repo)
+        cas = CasPaths.from_repo_root(repo)
+
+        p1_path = repo / "p1.bin"
+        p1_path.write_bytes(b"hello")
+        p1_id = sha256_file(p1_path)
+        store_blob(p1_path, cas, p1_id)
+        admit_digest = sha256_bytes(b"admit")
+        write_node_manifest(
+            repo,
+            Node(id=p1_id, parents=[], transform=Transform(name="admit", digest=admit_digest, params={})),
+        )
+
+        t_id = _install_trusted_transform(repo, cas)
+
+        # Child artifact that does *not* match transform output
+        bad = repo / "bad.bin"
+        bad.write_bytes(b"EVIL")
+        bad_id = sha256_file(bad)
+        store_blob(bad, cas, bad_id)
+
+        write_node_manifest(
+            repo,
+            Node(
+                id=bad_id,
+                parents=[p1_id],
+                transform=Transform(name="concat", digest=t_id, params={}, runner=["python3"]),
+            ),
+        )
+
+        wd = repo / "replay-wd"
+        rr = replay_node(repo, bad_id, workdir=wd)
+        assert not rr.ok
+        assert any("derivation mismatch" in e for e in rr.errors)
+        assert not (wd / f"transform_{t_id}.py").exists()
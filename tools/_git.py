@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import functools
+import subprocess
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=1)
+def repo_root_and_git_dir() -> tuple[Path, Path]:
+    """Resolve (repo toplevel, git common dir) in one git invocation.
+
+    --git-common-dir points at the shared git dir even from a worktree,
+    which is where hooks live.
+    """
+    out = subprocess.check_output(
+        ["git", "rev-parse", "--show-toplevel", "--git-common-dir"], text=True
+    ).splitlines()
+    repo_root = Path(out[0])
+    gd = Path(out[1])
+    if not gd.is_absolute():
+        gd = (repo_root / gd).resolve()
+    return repo_root, gd
@@ -4,30 +4,35 @@ import argparse
 import subprocess
 import sys
 
-PROTECTED_PREFIXES = ("ledger/objects/", "ledger/nodes/")
+PROTECTED_PREFIXES = (b"ledger/objects/", b"ledger/nodes/")
 
 
-def _touches_protected(paths: list[str]) -> bool:
+def _touches_protected(paths: list[bytes]) -> bool:
     return any(p.startswith(PROTECTED_PREFIXES) for p in paths)
 
 
-def _parse_name_status_line(line: str) -> tuple[str, list[str]]:
-    """Parse a single `git diff --name-status` line.
+def _iter_name_status(out: bytes):
+    """Yield (status, paths) records from `git diff -z --name-status` output.
 
-    Expected formats (tab-delimited):
-      - "M\tpath"
-      - "A\tpath"
-      - "D\tpath"
-      - "R100\told\tnew" (rename)
-      - "C100\told\tnew" (copy)
+    With -z, output is a flat NUL-delimited stream:
+      - "M" NUL path NUL            (also A/D/T/...)
+      - "R100" NUL old NUL new NUL  (rename; likewise "C100" for copy)
+
+    Paths are yielded as bytes (no quoting with -z); callers decode only
+    the paths they actually report.
     """
-    parts = line.rstrip("\n").split("\t")
-    if len(parts) < 2:
-        # Extremely defensive: fall back to whitespace split.
-        parts = line.split()
-    status = parts[0]
-    paths = [p for p in parts[1:] if p]
-    return status, paths
+    records = out.split(b"\x00")
+    i = 0
+    n = len(records)
+    while i < n:
+        status = records[i]
+        if not status:
+            i += 1
+            continue
+        npaths = 2 if status[:1] in (b"R", b"C") else 1
+        paths = [p for p in records[i + 1 : i + 1 + npaths] if p]
+        i += 1 + npaths
+        yield status.decode("ascii", errors="replace"), paths
 
 def main() -> int:
     # In CI on GitHub Actions, base SHA is available in GITHUB_BASE_REF context only for PRs.
@@ -55,36 +60,37 @@ def main() -> int:
         print("error: pass either base_ref OR --cached, not both", file=sys.stderr)
         return 3
 
+    # -z: NUL-delimited, unquoted output — parsed bytewise, no per-line decode.
+    # Deliberately NO pathspec: limiting the diff to the protected dirs
+    # makes git rewrite a rename/copy *into* them as a plain A (the
+    # out-of-pathspec source is filtered, so the R/C pairing vanishes)
+    # and the violation slips through. Filtering stays in Python via
+    # _touches_protected.
     if args.cached:
-        diff_cmd = ["git", "diff", "--cached", "--name-status"]
+        diff_cmd = ["git", "diff", "--cached", "-z", "--name-status"]
     else:
         if args.base_ref:
             diff_range = f"{args.base_ref}...HEAD"
         else:
             diff_range = "HEAD~1...HEAD"
-        diff_cmd = ["git", "diff", "--name-status", diff_range]
+        diff_cmd = ["git", "diff", "-z", "--name-status", diff_range]
 
     try:
-        out = subprocess.check_output(diff_cmd, text=True)
+        out = subprocess.check_output(diff_cmd)
     except Exception as e:
         print(f"failed running git diff: {e}", file=sys.stderr)
         return 3
 
     bad: list[tuple[str, list[str]]] = []
-    for line in out.splitlines():
-        if not line.strip():
-            continue
-        status, paths = _parse_name_status_line(line)
+    for status, bpaths in _iter_name_status(out):
         status_code = status[:1]  # e.g. "R" from "R100"
 
-        if _touches_protected(paths):
+        if _touches_protected(bpaths):
             # Only additions are allowed under protected prefixes.
             # Renames/copies report two paths; treat those as violations.
-            if status_code != "A":
-                bad.append((status, paths))
-            elif len(paths) != 1:
-                # Extremely defensive: an "A" line is expected to have a single path.
-                bad.append((status, paths))
+            # Paths are decoded only here, for the violation report.
+            if status_code != "A" or len(bpaths) != 1:
+                bad.append((status, [p.decode("utf-8", errors="replace") for p in bpaths]))
 
     if bad:
         print("append-only invariant violated (nodes/objects must be add-only):", file=sys.stderr)
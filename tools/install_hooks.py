@@ -5,42 +5,39 @@ import shutil
 import subprocess
 from pathlib import Path
 
-
-def _repo_root_from_cwd() -> Path:
-    """Find repo root by walking upward until ./ledger exists."""
-
-    p = Path.cwd().resolve()
-    for _ in range(20):
-        if (p / "ledger").exists():
-            return p
-        if p.parent == p:
-            break
-        p = p.parent
-    raise SystemExit("Could not find repo root (missing ./ledger directory). Run from inside the repo.")
-
-
-def _git_dir(repo_root: Path) -> Path:
-    """Resolve the git directory (supports worktrees)."""
-
-    out = subprocess.check_output(["git", "rev-parse", "--git-dir"], cwd=str(repo_root), text=True).strip()
-    gd = Path(out)
-    if not gd.is_absolute():
-        gd = (repo_root / gd).resolve()
-    return gd
+from _git import repo_root_and_git_dir
 
 
 def main() -> int:
-    repo_root = _repo_root_from_cwd()
+    # One git invocation resolves both the toplevel and the (possibly
+    # worktree-shared) git dir; replaces the old parent-directory walk
+    # plus separate rev-parse call.
+    try:
+        repo_root, gd = repo_root_and_git_dir()
+    except subprocess.CalledProcessError:
+        raise SystemExit("not inside a git repository")
+
     src = repo_root / "tools" / "hooks" / "pre-commit"
     if not src.exists():
         raise SystemExit(f"missing hook template: {src}")
 
-    gd = _git_dir(repo_root)
     hooks_dir = gd / "hooks"
     hooks_dir.mkdir(parents=True, exist_ok=True)
 
     dst = hooks_dir / "pre-commit"
-    shutil.copyfile(src, dst)
+    # Prefer a hardlink: zero-byte install. Note this does NOT track
+    # template updates — checkout replaces tools/hooks/pre-commit with a
+    # new inode, breaking the link, so re-run this script after the hook
+    # template changes. Falls back to a copy on Windows or
+    # cross-filesystem git dirs.
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
 
     # Make executable (POSIX). On Windows this is a no-op.
     try:
@@ -1,20 +1,36 @@
 from __future__ import annotations
 
 import argparse
+import json
+import os
+import re
 import subprocess
 import sys
 from pathlib import Path
 
+from ledger.manifest import read_node_manifest
 from ledger.replay import replay_node
 
 
-def _parse_name_status_line(line: str) -> tuple[str, list[str]]:
-    parts = line.rstrip("\n").split("\t")
-    if len(parts) < 2:
-        parts = line.split()
-    status = parts[0]
-    paths = [p for p in parts[1:] if p]
-    return status, paths
+_HEX64 = re.compile(rb"[0-9a-f]{64}").fullmatch
+
+
+def _iter_name_status(out: bytes):
+    # NUL-delimited `git diff -z --name-status` stream: a status token
+    # followed by one path (two for R/C records). Paths stay bytes until
+    # a caller actually needs them.
+    records = out.split(b"\x00")
+    i = 0
+    n = len(records)
+    while i < n:
+        status = records[i]
+        if not status:
+            i += 1
+            continue
+        npaths = 2 if status[:1] in (b"R", b"C") else 1
+        paths = [p for p in records[i + 1 : i + 1 + npaths] if p]
+        i += 1 + npaths
+        yield status.decode("ascii", errors="replace"), paths
 
 
 def _repo_root() -> Path:
@@ -22,6 +38,42 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+def _replay_cache_path(repo_root: Path) -> Path:
+    # Untracked working state, like ledger/.locks/ (ignore in git).
+    return repo_root / "ledger" / ".replay_cache.json"
+
+
+def _load_replay_cache(repo_root: Path) -> dict:
+    # A cache hit is sound because the ledger is content-addressed and
+    # append-only: the inputs that produced a node id cannot change, so a
+    # replay that succeeded for (node_id, transform_digest) stays valid.
+    try:
+        with _replay_cache_path(repo_root).open("rb") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_replay_cache(repo_root: Path, cache: dict) -> None:
+    p = _replay_cache_path(repo_root)
+    tmp = p.with_suffix(f".tmp{os.getpid()}")
+    try:
+        tmp.write_text(json.dumps(cache, sort_keys=True, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, p)
+    except OSError as e:
+        print(f"warning: could not write replay cache: {e}", file=sys.stderr)
+
+
+def _transform_digest(repo_root: Path, nid: str) -> str | None:
+    try:
+        t = read_node_manifest(repo_root, nid).get("transform", {})
+    except Exception:
+        return None
+    d = t.get("digest") if isinstance(t, dict) else None
+    return d if isinstance(d, str) and len(d) == 64 else None
+
+
 def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description="Replay derivations for node manifests added in a diff range",
@@ -36,37 +88,76 @@ def main(argv: list[str] | None = None) -> int:
 
     diff_range = f"{args.base_ref}...HEAD"
     try:
-        out = subprocess.check_output(["git", "diff", "--name-status", diff_range], text=True)
+        out = subprocess.check_output(["git", "diff", "-z", "--name-status", diff_range])
     except Exception as e:
         print(f"failed running git diff: {e}", file=sys.stderr)
         return 3
 
-    new_node_ids: list[str] = []
-    for line in out.splitlines():
-        if not line.strip():
-            continue
-        status, paths = _parse_name_status_line(line)
-        status_code = status[:1]
-        if status_code != "A":
+    # A set from the start: diffs can legitimately mention the same
+    # manifest path more than once, and downstream wants unique ids.
+    new_node_ids: set[str] = set()
+    prefix = b"ledger/nodes/"
+    suffix = b".json"
+    for status, paths in _iter_name_status(out):
+        if status[:1] != "A":
             continue
-        for p in paths:
-            if not p.startswith("ledger/nodes/"):
+        for bp in paths:
+            if not bp.startswith(prefix):
                 continue
-            if not p.endswith(".json"):
+            if not bp.endswith(suffix):
                 continue
-            node_id = Path(p).stem
-            if len(node_id) == 64:
-                new_node_ids.append(node_id)
+            # Slice "<prefix><id>.json" directly; no Path object needed.
+            # Strict 64-hex match: a stray .json under ledger/nodes/
+            # should be ignored here, not fail deep inside replay_node.
+            nid = bp[len(prefix) : -len(suffix)]
+            if _HEX64(nid):
+                new_node_ids.add(nid.decode("ascii"))
 
     if not new_node_ids:
         print("replay check: no new nodes")
         return 0
 
+    # Replays are independent (immutable CAS inputs, private temp
+    # workdirs), so fan them out. Threads suffice: the heavy work runs in
+    # the transform subprocess, so workers mostly block on wait() and a
+    # process pool would only add pickling overhead. Results are
+    # collected in sorted-id order so failure output stays deterministic.
+    all_ids = sorted(new_node_ids)
+
+    # Skip nodes whose (id, transform digest) already replayed OK in a
+    # previous run of this check.
+    cache = _load_replay_cache(repo_root)
+    digests = {nid: _transform_digest(repo_root, nid) for nid in all_ids}
+    ids = [
+        nid
+        for nid in all_ids
+        if not (
+            isinstance(cache.get(nid), dict)
+            and cache[nid].get("ok") is True
+            and digests[nid] is not None
+            and cache[nid].get("t_digest") == digests[nid]
+        )
+    ]
+    cached = len(all_ids) - len(ids)
+
+    if len(ids) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(len(ids), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(lambda nid: replay_node(repo_root, nid), ids))
+    else:
+        results = [replay_node(repo_root, nid) for nid in ids]
+
     failures: list[tuple[str, list[str]]] = []
-    for nid in sorted(set(new_node_ids)):
-        rr = replay_node(repo_root, nid)
+    for nid, rr in zip(ids, results):
         if not rr.ok:
             failures.append((nid, rr.errors))
+        elif digests[nid] is not None:
+            cache[nid] = {"t_digest": digests[nid], "ok": True}
+
+    if ids:
+        _save_replay_cache(repo_root, cache)
 
     if failures:
         print("replay check FAILED", file=sys.stderr)
@@ -76,7 +167,8 @@ def main(argv: list[str] | None = None) -> int:
                 print(f"    {e}", file=sys.stderr)
         return 2
 
-    print(f"replay check: OK ({len(set(new_node_ids))} new node(s))")
+    suffix = f", {cached} cached" if cached else ""
+    print(f"replay check: OK ({len(all_ids)} new node(s){suffix})")
     return 0
 
 